@@ -42,6 +42,20 @@ _url = 'https://github.com/dewloosh/LinkedDeepDict'
 _download_url = _url + '/archive/refs/tags/{}.zip'.format(_version)
 
 
+# Optionally compile the core module with mypyc, if it is asked for with the 
+# LINKEDDEEPDICT_USE_MYPYC=1 environment variable and mypyc is available.
+# Otherwise, the package is installed as pure Python.
+_ext_modules = []
+if os.environ.get('LINKEDDEEPDICT_USE_MYPYC', '0') == '1':
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        pass
+    else:
+        _ext_modules = mypycify(['--follow-imports=silent',
+                                  'src/linkeddeepdict/linkeddeepdict.py'])
+
+
 setup(
 	name="linkeddeepdict",
     version=_version,                        
@@ -66,6 +80,7 @@ setup(
     python_requires='>=3.7, <3.11',                             
     package_dir={'':'src'},     
     install_requires=required,
+    ext_modules=_ext_modules,
 	zip_safe=False,
 )
 
@@ -1,12 +1,18 @@
 # http://stackoverflow.com/a/6190500/562769
-from typing import Hashable, Union, Tuple, Any, TypeVar, Generic, Dict, Optional, MutableMapping
+from typing import (Hashable, Union, Tuple, Any, TypeVar, Generic, Optional, 
+                    Dict, ClassVar, Callable)
+from collections.abc import Iterable
+
 try:
-    from collections.abc import Iterable
-except ImportError:
-    from collections import Iterable
-import six
+    from mypy_extensions import mypyc_attr
+except ImportError:  # pragma: no cover
+    # only needed when the module is compiled with mypyc
+    _T = TypeVar("_T")
+    
+    def mypyc_attr(*attrs: str, **kwattrs: object) -> Callable[[_T], _T]:
+        return lambda cls: cls
 
-from .tools.dtk import dictparser, parseitems, parseaddress, parsedicts
+from .tools.dtk import parsedicts
 
 
 # https://stackoverflow.com/questions/61112684/how-to-subclass-a-dictionary-so-it-supports-generic-type-hints
@@ -16,20 +22,128 @@ __all__ = ['LinkedDeepDict']
 
 
 NoneType = type(None)
+_MISSING = object()
+
+# unbound methods of `dict`, called directly on the hot paths of the
+# dunder methods of `LinkedDeepDict`
+_dict_get = dict.get
+_dict_setitem = dict.__setitem__
+_dict_delitem = dict.__delitem__
+_dict_contains = dict.__contains__
 
 
 def issequence(arg) -> bool:
     return (
         isinstance(arg, Iterable)
-        and not isinstance(arg, six.string_types)
+        and not isinstance(arg, (str, bytes))
     )  
 
 
+def _parsekey(key) -> Tuple[Any, bool]:
+    # Returns the key to use and whether it is an address. A single element
+    # tuple stands for its element.
+    if type(key) is tuple:
+        if len(key) == 1:
+            return key[0], False
+        return key, True
+    return key, issequence(key)
+
+
+def _lookup(d: dict, key, default):
+    # Returns the value at `key` in `d`, or `default`, without creating
+    # new levels. It lives here and not in `LinkedDeepDict.get`, since 
+    # mypyc turns `self.get` calls of a dict subclass into `dict.get`.
+    key, is_address = _parsekey(key)
+    if not is_address:
+        return _dict_get(d, key, default)
+    if len(key) == 0:
+        return default
+    node: Any = d
+    for subkey in key:
+        if not isinstance(node, dict):
+            return default
+        node = _dict_get(node, subkey, _MISSING)
+        if node is _MISSING:
+            return default
+    return node
+
+
+def _assignment_lines(node: str, key: str, indent: str) -> list:
+    # Source lines of the assignment of `value` to `key` in `node`, the 
+    # same way `LinkedDeepDict.__setitem__` does it with a scalar key.
+    lines = [
+        "if {}.locked:".format(node),
+        "    raise RuntimeError('The object is locked!')",
+        "d = _get({}, {}, _MISSING)".format(node, key),
+        "if isinstance(d, LinkedDeepDict):",
+        "    d.__leave_parent__()",
+        "if value is not None:",
+        "    if isinstance(value, LinkedDeepDict):",
+        "        value.__join_parent__({}, {})".format(node, key),
+        "    return _setitem({}, {}, value)".format(node, key),
+        "if d is not _MISSING:",
+        "    _delitem({}, {})".format(node, key),
+        "return",
+    ]
+    return [indent + line for line in lines]
+
+
+def _specialized_setitem(cls: type, max_depth: int, generic):
+    """
+    Returns a `__setitem__` implementation for `cls` with the handling of 
+    scalar keys and tuple keys of lengths from 2 to `max_depth` inlined. 
+    Other keys are delegated to `generic`.
+    """
+    lines = [
+        "def __setitem__(self, key, value):",
+        "    if type(key) is tuple:",
+        "        n = len(key)",
+    ]
+    for n in range(2, max_depth + 1):
+        names = ["k{}".format(i) for i in range(n)]
+        lines += [
+            "        if n == {}:".format(n),
+            "            if self.locked:",
+            "                raise RuntimeError('The object is locked!')",
+            "            {} = key".format(", ".join(names)),
+            "            node = self",
+        ]
+        for name in names[:-1]:
+            lines += [
+                "            d = _get(node, {}, _MISSING)".format(name),
+                "            if d is _MISSING:",
+                "                if node.locked:",
+                "                    raise RuntimeError('The object is locked!')",
+                "                d = node.__missing__({})".format(name),
+                "            node = d",
+            ]
+        lines += [
+            "            if type(node) is not cls:",
+            "                node[{}] = value".format(names[-1]),
+            "                return",
+        ]
+        lines += _assignment_lines("node", names[-1], " " * 12)
+    lines.append("    elif not issequence(key):")
+    lines += _assignment_lines("self", "key", " " * 8)
+    lines.append("    generic(self, key, value)")
+    namespace = dict(
+        _get=_dict_get, _setitem=_dict_setitem, _delitem=_dict_delitem,
+        _MISSING=_MISSING, LinkedDeepDict=LinkedDeepDict, cls=cls, 
+        issequence=issequence, generic=generic
+    )
+    exec("\n".join(lines), namespace)
+    return namespace["__setitem__"]
+
+
+_specializations: Dict[Tuple[type, int], type] = {}
+
+
 KT = TypeVar("KT")
 VT = TypeVar("VT")
 
 
-class LinkedDeepDict(Generic[KT, VT], MutableMapping[KT, VT]):
+@mypyc_attr(allow_interpreted_subclasses=True)
+class LinkedDeepDict(dict, Generic[KT, VT]):
     """
     An nested dictionary class with a self-replicating default factory. 
     It can be a drop-in replacement for the bulit-in dictionary type, 
@@ -49,8 +163,15 @@ class LinkedDeepDict(Generic[KT, VT], MutableMapping[KT, VT]):
         
     """
     
-    def __init__(self, *args, parent:'LinkedDeepDict'=None, 
-                 root:'LinkedDeepDict'=None, locked:bool=None, 
+    __slots__ = ('parent', '_root', '_locked', '_key', '_cached_depth', 
+                 '_cached_locked', '_cached_address', '__weakref__')
+    
+    # The class used to create new levels on missing keys. `None` means 
+    # the type of the instance itself.
+    _factory: ClassVar[Optional[type]] = None
+    
+    def __init__(self, *args, parent:Optional['LinkedDeepDict']=None, 
+                 root:Optional['LinkedDeepDict']=None, locked:Optional[bool]=None, 
                  **kwargs):
         """
         Returns a `LinkedDeepDict` instance.
@@ -71,17 +192,29 @@ class LinkedDeepDict(Generic[KT, VT], MutableMapping[KT, VT]):
             is inherited from its parent. Default is `None`.
         **kwargs: tuple, Optional
             Extra keyword arguments are forwarded to the `dict` class.
+            
+        Notes
+        -----
+        Tuple keys of the initial data are handled as addresses, the same way
+        as if the items were set one by one.
         """
-        self.data: Dict[KT, VT] = {}
-        for k, v in kwargs.items():
-            if isinstance(v, LinkedDeepDict):
-                v.parent = self
-                v._key = k
         super().__init__(*args, **kwargs)
-        self.parent = parent
+        self.parent: Optional[LinkedDeepDict] = None
+        self._root: Optional[LinkedDeepDict] = None
+        self._locked: Optional[bool] = None
+        self._key: Optional[Hashable] = None
+        self._cached_depth: Any = _MISSING
+        self._cached_locked: Any = _MISSING
+        self._cached_address: Any = _MISSING
+        addresses = [k for k in dict.keys(self) if type(k) is tuple]
+        for address in addresses:
+            self[address] = dict.pop(self, address)
+        self.__adopt__()
+        if parent is not None or locked is not None:
+            self.parent = parent
+            self._locked = locked
+            self.__reset_cache__()
         self._root = root
-        self._locked = locked
-        self._key = None
         
     @property
     def key(self) -> Union[Hashable, NoneType]:
@@ -96,30 +229,63 @@ class LinkedDeepDict(Generic[KT, VT], MutableMapping[KT, VT]):
         """
         Returns `True` if the object is locked. The property is equpped with a setter.
         """
-        if self.parent is None:
-            return self._locked if isinstance(self._locked, bool) else False
-        else:
-            return self._locked if isinstance(self._locked, bool) else self.parent.locked
+        locked = self._cached_locked
+        if locked is _MISSING:
+            path = []
+            node = self
+            while True:
+                locked = node._cached_locked
+                if locked is not _MISSING:
+                    break
+                path.append(node)
+                if isinstance(node._locked, bool):
+                    locked = node._locked
+                    break
+                if node.parent is None:
+                    locked = False
+                    break
+                node = node.parent
+            for node in path:
+                node._cached_locked = locked
+        return locked
 
     @property
     def depth(self) -> int:
         """
         Retuns the depth of the actual instance in a layout, starting from 0..
         """
-        if self.parent is None:
-            return 0
-        else:
-            return self.parent.depth + 1
+        depth = self._cached_depth
+        if depth is _MISSING:
+            path = []
+            node = self
+            while node._cached_depth is _MISSING and node.parent is not None:
+                path.append(node)
+                node = node.parent
+            depth = node._cached_depth
+            if depth is _MISSING:
+                node._cached_depth = depth = 0
+            for node in reversed(path):
+                depth += 1
+                node._cached_depth = depth
+        return depth
         
     @property
     def address(self) -> Tuple:
         """Returns the address of an item."""
-        if self.is_root():
-            return []
-        else:
-            r = self.parent.address
-            r.append(self.key)
-            return r
+        address = self._cached_address
+        if address is _MISSING:
+            path = []
+            node = self
+            while node._cached_address is _MISSING and node.parent is not None:
+                path.append(node)
+                node = node.parent
+            address = node._cached_address
+            if address is _MISSING:
+                node._cached_address = address = ()
+            for node in reversed(path):
+                address += (node._key,)
+                node._cached_address = address
+        return address
 
     def lock(self):
         """
@@ -130,6 +296,7 @@ class LinkedDeepDict(Generic[KT, VT], MutableMapping[KT, VT]):
         
         """
         self._locked = True
+        self.__reset_cache__()
 
     def unlock(self):
         """
@@ -139,6 +306,7 @@ class LinkedDeepDict(Generic[KT, VT], MutableMapping[KT, VT]):
         
         """
         self._locked = False
+        self.__reset_cache__()
         
     def root(self):
         """
@@ -146,11 +314,68 @@ class LinkedDeepDict(Generic[KT, VT], MutableMapping[KT, VT]):
         """
         if self.parent is None:
             return self
-        else:
-            if self._root is not None:
-                return self._root
-            else:
-                return self.parent.root()
+        root = self._root
+        if root is None:
+            path = []
+            node = self
+            while node.parent is not None and node._root is None:
+                path.append(node)
+                node = node.parent
+            root = node if node.parent is None else node._root
+            for node in path:
+                node._root = root
+        return root
+
+    @classmethod
+    def specialize(cls, max_depth: int) -> type:
+        """
+        Returns a subclass with item assignment specialized for layouts with a 
+        known maximum depth. Setting items with tuple keys of length up to 
+        `max_depth` avoids the generic handling of addresses. Longer keys 
+        still work, but fall back to the generic implementation at the cost
+        of an extra call. The returned classes are cached.
+        
+        Parameters
+        ----------
+        max_depth: int
+            The length of the longest address to specialize for. Must be
+            at least 2.
+
+        Returns
+        -------
+        type
+            A subclass of the class the call is made upon, named after it 
+            and `max_depth`, like `LinkedDeepDictDepth3`.
+            
+        Notes
+        -----
+        The returned class is created dynamically, hence its instances
+        can't be pickled.
+        
+        Examples
+        --------
+        >>> from linkeddeepdict import LinkedDeepDict
+        >>> DeepDict3 = LinkedDeepDict.specialize(3)
+        >>> data = DeepDict3()
+        >>> data['a', 'b', 'c'] = 1
+        >>> data['a', 'b', 'c']
+        1
+        >>> data
+        LinkedDeepDictDepth3({'a': LinkedDeepDictDepth3({'b': LinkedDeepDictDepth3({'c': 1})})})
+        """
+        if not isinstance(max_depth, int) or max_depth < 2:
+            raise ValueError("'max_depth' must be an integer greater than 1.")
+        key = (cls, max_depth)
+        if key not in _specializations:
+            name = "{}Depth{}".format(cls.__name__, max_depth)
+            subcls = type(name, (cls,), {
+                '__slots__': (),
+                '__module__': getattr(cls, '__module__', __name__),
+            })
+            subcls.__setitem__ = _specialized_setitem(  # type: ignore
+                subcls, max_depth, cls.__setitem__)
+            _specializations[key] = subcls
+        return _specializations[key]
 
     def is_root(self) -> bool:
         """
@@ -214,93 +439,214 @@ class LinkedDeepDict(Generic[KT, VT], MutableMapping[KT, VT]):
         return parsedicts(self, inclusive=inclusive, dtype=dtype, deep=deep)
 
     def __getitem__(self, key):
-        try:
-            if issequence(key):
-                return parseaddress(self, key)
-            else:
-                return super().__getitem__(key)
-        except ValueError:
-            return self.__missing__(key)
-        except KeyError:
+        _get = _dict_get
+        if type(key) is tuple:
+            # a single element tuple is the same as its element as a key
+            is_address = len(key) != 1
+            if not is_address:
+                key = key[0]
+        else:
+            is_address = issequence(key)
+        if is_address:
+            if len(key) == 0:
+                raise KeyError(key)
+            node = self
+            for subkey in key:
+                value = _get(node, subkey, _MISSING)
+                if value is _MISSING:
+                    value = node.__missing__(subkey)
+                node = value
+            return node
+        value = _get(self, key, _MISSING)
+        if value is _MISSING:
             return self.__missing__(key)
+        return value
         
     def __delitem__(self, key):
         if self.locked:
             raise RuntimeError("The object is locked!")
-        super().__delitem__(key)
+        key, is_address = _parsekey(key)
+        node = self
+        if is_address:
+            if len(key) == 0:
+                raise KeyError(key)
+            for subkey in key[:-1]:
+                if not isinstance(node, dict):
+                    raise KeyError(key)
+                node = _dict_get(node, subkey, _MISSING)
+                if node is _MISSING:
+                    raise KeyError(key)
+            key = key[-1]
+            if type(node) is not type(self):
+                del node[key]
+                return
+            if node.locked:
+                raise RuntimeError("The object is locked!")
+        value = dict.pop(node, key)
+        if isinstance(value, LinkedDeepDict):
+            value.__leave_parent__()
 
     def __setitem__(self, key, value):
+        _get = _dict_get
         if self.locked:
             raise RuntimeError("The object is locked!")
-        try:
-            if issequence(key):
-                if not key[0] in self:
-                    d = self.__missing__(key[0])
-                else:
-                    d = self[key[0]]
-                if len(key) > 1:
-                    d.__setitem__(key[1:], value)
-                else:
-                    d = self[key[0]]
-                    if isinstance(d, LinkedDeepDict):
-                        d.__leave_parent__()
-                    if value is None:
-                        del self[key[0]]
-                    else:
-                        self[key[0]] = value
-            else:
-                if key in self:
-                    d = self[key]
-                    if isinstance(d, LinkedDeepDict):
-                        d.__leave_parent__()
-                if value is None:
-                    if key in self:
-                        del self[key]
-                else:
-                    if isinstance(value, LinkedDeepDict):
-                        value.__join_parent__(self, key)
-                    return super().__setitem__(key, value)
-        except KeyError:
-            return self.__missing__(key)
+        if type(key) is tuple:
+            # a single element tuple is the same as its element as a key
+            is_address = len(key) != 1
+            if not is_address:
+                key = key[0]
+        else:
+            is_address = issequence(key)
+        node = self
+        if is_address:
+            if len(key) == 0:
+                raise KeyError(key)
+            for subkey in key[:-1]:
+                d = _get(node, subkey, _MISSING)
+                if d is _MISSING:
+                    if node.locked:
+                        raise RuntimeError("The object is locked!")
+                    d = node.__missing__(subkey)
+                node = d
+            key = key[-1]
+            if type(node) is not type(self):
+                node[key] = value
+                return
+            if node.locked:
+                raise RuntimeError("The object is locked!")
+        d = _get(node, key, _MISSING)
+        if isinstance(d, LinkedDeepDict):
+            d.__leave_parent__()
+        if value is not None:
+            if isinstance(value, LinkedDeepDict):
+                value.__join_parent__(node, key)
+            return _dict_setitem(node, key, value)
+        # setting an item to `None` removes it
+        if d is not _MISSING:
+            _dict_delitem(node, key)
 
     def __missing__(self, key):
+        # `key` is a single key here, addresses are resolved level by level
+        # by the callers
         if self.locked:
             raise KeyError("Missing key : {}".format(key))
-        if issequence(key):
-            if key[0] not in self:
-                self[key[0]] = value = self.__class__()
-            else:
-                value = self[key[0]]
-            if len(key) > 1:
-                return value.__missing__(key[1:])
-            else:
-                return value
-        else:
-            self[key] = value = self.__class__()
-            return value
+        factory = self._factory
+        value = (type(self) if factory is None else factory)()
+        value.__join_parent__(self, key)
+        _dict_setitem(self, key, value)
+        return value
         
     def __contains__(self, item: Any):
-        if not isinstance(item, Hashable) and issequence(item):
-            if len(item) == 0:
-                raise ValueError(f"{item} has zero length")
-            else:
-                obj = self
-                for subitem in item:
-                    if not isinstance(subitem, Hashable):
-                        raise TypeError(f"{subitem} is not hashable")
-                    else:
-                        if obj.__contains__(subitem):
-                            obj = obj.__getitem__(subitem)
-                        else:
-                            return False
-                return True
-        elif isinstance(item, Hashable):
-            return super().__contains__(item)
+        _get = _dict_get
+        if type(item) is tuple:
+            if len(item) == 1:
+                return _dict_contains(self, item[0])
         else:
-            raise TypeError(f"{item} is not hashable")
+            try:
+                return _dict_contains(self, item)
+            except TypeError:
+                if not issequence(item):
+                    raise TypeError(f"{item} is not hashable")
+        if len(item) == 0:
+            raise ValueError(f"{item} has zero length")
+        node: Any = self
+        for subitem in item:
+            if not isinstance(node, dict):
+                return False
+            node = _get(node, subitem, _MISSING)
+            if node is _MISSING:
+                return False
+        return True
         
     def __reduce__(self):
-        return self.__class__, tuple(), None, None, self.items()
+        return self.__class__, (), dict(self)
+    
+    def __setstate__(self, state):
+        dict.update(self, state)
+        self.__adopt__()
+        
+    def __adopt__(self):
+        # Links the children without a parent to the object. Children of 
+        # other layouts are left intact.
+        for k, v in dict.items(self):
+            if isinstance(v, LinkedDeepDict) and v.parent is None:
+                v.__join_parent__(self, k)
+                
+    def get(self, key, default=None):
+        """
+        Returns the value for `key` if it is in the dictionary, `default` 
+        otherwise. Unlike indexing, it never creates new levels and `key`
+        may also be an address.
+        """
+        return _lookup(self, key, default)
+    
+    def setdefault(self, key, default=None):
+        """
+        Returns the value for `key` if it is in the dictionary, otherwise
+        sets it to `default` and returns `default`. `key` may also be an 
+        address.
+        """
+        value = _lookup(self, key, _MISSING)
+        if value is _MISSING:
+            self[key] = value = default
+        return value
+    
+    def pop(self, key, default=_MISSING):
+        """
+        Removes `key` from the dictionary and returns its value. If `key` 
+        is missing, `default` is returned if it is provided, otherwise a 
+        `KeyError` is raised. `key` may also be an address.
+        """
+        value = _lookup(self, key, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        del self[key]
+        return value
+    
+    def popitem(self):
+        """
+        Removes and returns the last inserted (key, value) pair.
+        """
+        if self.locked:
+            raise RuntimeError("The object is locked!")
+        key, value = dict.popitem(self)
+        if isinstance(value, LinkedDeepDict):
+            value.__leave_parent__()
+        return key, value
+    
+    def clear(self):
+        """
+        Removes all items from the dictionary.
+        """
+        if self.locked:
+            raise RuntimeError("The object is locked!")
+        for value in dict.values(self):
+            if isinstance(value, LinkedDeepDict):
+                value.__leave_parent__()
+        dict.clear(self)
+        
+    def update(self, *args, **kwargs):
+        """
+        Updates the dictionary the same way `dict.update` does, but the 
+        items are set one by one like `self[key] = value` would.
+        """
+        if len(args) > 1:
+            raise TypeError(
+                "update expected at most 1 argument, got {}".format(len(args)))
+        if args:
+            other = args[0]
+            if isinstance(other, dict):
+                items = list(dict.items(other))
+            elif hasattr(other, 'keys'):
+                items = [(k, other[k]) for k in other.keys()]
+            else:
+                items = list(other)
+            for key, value in items:
+                self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
     
     def __repr__(self):
         frmtstr = self.__class__.__name__ + '(%s)'
@@ -308,46 +654,109 @@ class LinkedDeepDict(Generic[KT, VT], MutableMapping[KT, VT]):
        
     def __leave_parent__(self):
         self.parent = None
-        self._root = None
         self._key = None
+        self.__reset_cache__()
             
     def __join_parent__(self, parent, key: Hashable = None):
         self.parent = parent
-        self._root = parent.root()
         self._key = key
+        self.__reset_cache__()
+        if parent.parent is None:
+            self._root = parent
+        else:
+            root = parent._root
+            self._root = parent.root() if root is None else root
+        
+    def __reset_cache__(self):
+        # Clears the memoized root, depth, address and lock state of the object and
+        # its descendants. A node only caches a value after all the ancestors
+        # it depends on did, hence subtrees without a cache can be skipped.
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node._root = None
+            node._cached_depth = _MISSING
+            node._cached_locked = _MISSING
+            node._cached_address = _MISSING
+            for value in dict.values(node):
+                if isinstance(value, LinkedDeepDict) and (
+                    value._root is not None
+                    or value._cached_depth is not _MISSING
+                    or value._cached_locked is not _MISSING
+                    or value._cached_address is not _MISSING
+                ):
+                    stack.append(value)
+
+    def _walk(self, return_address: bool = False):
+        # Yields the leaves of the layout in depth-first order as pairs of
+        # keys (or addresses) and values, using an explicit stack of iterators.
+        stack = [iter(dict.items(self))]
+        address = []
+        while stack:
+            for k, v in stack[-1]:
+                if isinstance(v, dict):
+                    stack.append(iter(dict.items(v)))
+                    address.append(k)
+                    break
+                yield (address + [k] if return_address else k), v
+            else:
+                stack.pop()
+                if address:
+                    address.pop()
 
     def items(self, *args, deep:bool=False, return_address:bool=False, **kwargs):
+        """
+        Returns the items of the dictionary. 
+        
+        Parameters
+        ----------
+        deep: bool, Optional
+            If `True`, the items of nested dictionaries are returned instead 
+            of the dictionaries themselves. Default is `False`.
+        return_address: bool, Optional
+            If `True`, the keys of nested items are replaced by their full 
+            addresses. Only has an effect if `deep` is `True`. Default is `False`.
+
+        Returns
+        -------
+        dict_items or generator
+            A view of the items, like `dict.items` does, if `deep` is `False`,
+            a generator otherwise.
+        """
         if deep:
-            if return_address:
-                for addr, v in dictparser(self):
-                    yield addr, v
-            else:
-                for k, v in parseitems(self):
-                    yield k, v
-        else:
-            for k, v in super().items():
-                yield k, v
+            return self._walk(return_address)
+        return dict.items(self)
 
     def values(self, *args, deep:bool=False, return_address:bool=False, **kwargs):
+        """
+        Returns the values of the dictionary. The meaning of the parameters
+        is the same as for `items`, but if `deep` and `return_address` are both
+        `True`, the values are returned as (address, value) pairs.
+
+        Returns
+        -------
+        dict_values or generator
+            A view of the values, like `dict.values` does, if `deep` is `False`,
+            a generator otherwise.
+        """
         if deep:
             if return_address:
-                for addr, v in dictparser(self):
-                    yield addr, v
-            else:
-                for _, v in parseitems(self):
-                    yield v
-        else:
-            for v in super().values():
-                yield v
+                return self._walk(True)
+            return (v for _, v in self._walk())
+        return dict.values(self)
 
     def keys(self, *args, deep:bool=False, return_address:bool=False, **kwargs):
+        """
+        Returns the keys, or the addresses if `deep` and `return_address` are 
+        both `True`, of the dictionary. The meaning of the parameters is the 
+        same as for `items`.
+
+        Returns
+        -------
+        dict_keys or generator
+            A view of the keys, like `dict.keys` does, if `deep` is `False`,
+            a generator otherwise.
+        """
         if deep:
-            if return_address:
-                for addr, _ in dictparser(self):
-                    yield addr
-            else:
-                for k, _ in parseitems(self):
-                    yield k
-        else:
-            for k in super().keys():
-                yield k
+            return (k for k, _ in self._walk(return_address))
+        return dict.keys(self)
@@ -24,14 +24,15 @@ def dictparser(d: dict = None, address=None, *args, dtype=dict, **kwargs):
 
 def parseaddress(d: dict, a: list):
     """Returns a value specified with an address."""
-    if not isinstance(d, dict):
-        raise ValueError
-    if not a[0] in d:
-        raise KeyError(a[0])
-    if len(a) > 1:
-        return parseaddress(d[a[0]], a[1:])
-    else:
-        return d[a[0]]
+    if len(a) == 0:
+        raise IndexError("The address is empty.")
+    for key in a:
+        if not isinstance(d, dict):
+            raise ValueError
+        if not key in d:
+            raise KeyError(key)
+        d = d[key]
+    return d
 
 
 def parseitems(d: dict = None, *args, dtype=dict, **kwargs):
@@ -56,13 +57,16 @@ def parsedicts(d: dict = None, *args, inclusive=True, dtype=dict,
     if inclusive:
         if isinstance(d, dtype):
             yield d
-    for value in d.values():
-        if isinstance(value, dtype):
-            yield value
-            if deep:
-                for subvalue in \
-                        parsedicts(value, inclusive=False, dtype=dtype):
-                    yield subvalue
+    stack = [iter(d.values())]
+    while stack:
+        for value in stack[-1]:
+            if isinstance(value, dtype):
+                yield value
+                if deep:
+                    stack.append(iter(value.values()))
+                    break
+        else:
+            stack.pop()
                     
                     
 def parsedicts_addr(d: dict = None, address=[], *args, inclusive=True,
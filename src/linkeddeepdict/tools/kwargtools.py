@@ -1,8 +1,5 @@
 # -*- coding: utf-8 -*-
-try:
-    from collections.abc import Iterable
-except ImportError:
-    from collections import Iterable
+from collections.abc import Iterable
 from typing import Callable
 
 
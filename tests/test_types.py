@@ -1,7 +1,14 @@
 # -*- coding: utf-8 -*-
 import unittest
+import pickle
+import copy
+import weakref
 
 from linkeddeepdict import LinkedDeepDict
+import linkeddeepdict.linkeddeepdict as ldd
+
+
+COMPILED = not ldd.__file__.endswith('.py')
 
 
 class TestDeepDict(unittest.TestCase):
@@ -20,6 +27,8 @@ class TestDeepDict(unittest.TestCase):
         assert [c.key for c in f(inclusive=False, deep=False)] == ['a']
         assert data['a', 'b'].depth == 2
         assert data['a', 'b'].key == 'b'
+        assert data['a', 'b'].address == ('a', 'b')
+        assert data.address == ()
         assert data.is_root() is True
         assert data['a', 'b'].is_root() is False
         assert data['a', 'b'].parent == data['a']
@@ -53,11 +62,188 @@ class TestDeepDict(unittest.TestCase):
         data['a', 'b'].root()
         data.__repr__()
         
+    def test_relink(self):
+        """
+        Tests that depth, root and lock state follow changes in the layout.
+        """
+        data = LinkedDeepDict()
+        sub = LinkedDeepDict()
+        sub['b', 'c'] = 1
+        assert sub['b'].depth == 1
+        assert sub['b'].root() is sub
+        data['a'] = sub
+        assert sub['b'].depth == 2
+        assert sub['b'].address == ('a', 'b')
+        assert sub['b'].root() is data
+        data.lock()
+        assert sub['b'].locked
+        data.unlock()
+        assert not sub['b'].locked
+        data['a'] = None
+        assert 'a' not in data
+        assert sub['b'].depth == 1
+        assert sub['b'].root() is sub
+
+    def test_init(self):
+        sub = LinkedDeepDict(c=1)
+        data = LinkedDeepDict({'a': sub}, b=LinkedDeepDict())
+        assert sub.parent is data
+        assert sub.address == ('a',)
+        assert data['b'].key == 'b'
+        # constructing from an existing layout leaves it intact
+        other = LinkedDeepDict(data)
+        assert other['a'] is sub
+        assert sub.parent is data
+        assert sub.root() is data
+        assert sub.address == ('a',)
+        copy.copy(data)
+        assert sub.parent is data
+        assert sub.depth == 1
+
+    def test_factory(self):
+        class Level(LinkedDeepDict):
+            pass
+
+        class Root(LinkedDeepDict):
+            _factory = Level
+
+        data = Root()
+        data['a', 'b', 'c'] = 1
+        assert type(data['a']) is Level
+        assert type(data['a', 'b']) is Level
+        assert data['a', 'b'].parent is data['a']
+        assert data['a', 'b'].key == 'b'
+        assert data['a', 'b'].address == ('a', 'b')
+        assert data['a', 'b'].root() is data
+
+    def test_specialize(self):
+        DeepDict = LinkedDeepDict.specialize(3)
+        assert LinkedDeepDict.specialize(3) is DeepDict
+        data = DeepDict()
+        data['a', 'b', 'c'] = 1
+        data['a', 'd'] = 2
+        data['a', 'b', 'e', 'f'] = 3
+        data['g'] = 4
+        assert data == {'a': {'b': {'c': 1, 'e': {'f': 3}}, 'd': 2}, 'g': 4}
+        assert isinstance(data['a', 'b'], DeepDict)
+        assert data['a', 'b', 'e'].address == ('a', 'b', 'e')
+        data['a', 'd'] = None
+        assert ('a', 'd') not in data
+        sub = data['a', 'b']
+        data['a', 'b'] = DeepDict(x=1)
+        assert sub.parent is None
+        assert data['a', 'b'].address == ('a', 'b')
+        data['g'] = None
+        assert 'g' not in data
+        assert DeepDict.__name__ == 'LinkedDeepDictDepth3'
+        assert repr(DeepDict()) == 'LinkedDeepDictDepth3({})'
+        data['a'].lock()
+        self.assertRaises(RuntimeError, data.__setitem__, ('a', 'h', 'c'), 0)
+        self.assertRaises(RuntimeError, data.__setitem__, ('a', 'd'), 0)
+        data.lock()
+        self.assertRaises(RuntimeError, data.__setitem__, ('a', 'b', 'c'), 0)
+        self.assertRaises(RuntimeError, data.__setitem__, 'g', 0)
+
+    def test_locked_sublevel(self):
+        data = LinkedDeepDict()
+        data['a', 'x'] = 1
+        data['a'].lock()
+        self.assertRaises(RuntimeError, data.__setitem__, ('a', 'b', 'c'), 1)
+        self.assertRaises(RuntimeError, data.__setitem__, ('a', 'x'), 2)
+        assert 'b' not in data['a']
+        assert data['a', 'x'] == 1
+
+    def test_dict_methods(self):
+        """
+        Tests that the inherited `dict` methods respect locking, linking
+        and addresses.
+        """
+        data = LinkedDeepDict()
+        data['a', 'b'] = 1
+        assert data.get(('a', 'b')) == 1
+        assert data.get(('a', 'c')) is None
+        assert data.get(('a', 'b', 'c'), 0) == 0
+        assert data.get('x', 0) == 0
+        assert 'x' not in data
+        data.update(x=LinkedDeepDict())
+        assert data['x'].parent is data
+        data.update({('y', 'z'): 2})
+        assert data['y', 'z'] == 2
+        assert data['y'].address == ('y',)
+        assert data.setdefault(('y', 'w'), 3) == 3
+        assert data.setdefault(('y', 'w'), 4) == 3
+        sub = data.setdefault('s', LinkedDeepDict())
+        assert sub.parent is data
+        assert data.pop(('y', 'w')) == 3
+        assert ('y', 'w') not in data
+        assert data.pop('q', None) is None
+        self.assertRaises(KeyError, data.pop, 'q')
+        sub = data.pop('s')
+        assert sub.parent is None
+        key, value = data.popitem()
+        assert key == 'y' and value.parent is None
+        
+        data.lock()
+        self.assertRaises(RuntimeError, data.update, x=1)
+        self.assertRaises(RuntimeError, data.update, {('a', 'c'): 1})
+        self.assertRaises(RuntimeError, data.setdefault, 'q', 1)
+        self.assertRaises(RuntimeError, data.setdefault, ('a', 'c'), 1)
+        self.assertRaises(RuntimeError, data.pop, 'x')
+        self.assertRaises(RuntimeError, data.pop, ('a', 'b'))
+        self.assertRaises(RuntimeError, data.popitem)
+        self.assertRaises(RuntimeError, data.clear)
+        self.assertRaises(RuntimeError, data.__delitem__, ('a', 'b'))
+        assert data.setdefault(('a', 'b'), 5) == 1
+        assert data == {'a': {'b': 1}, 'x': {}}
+        
+        data.unlock()
+        x = data['x']
+        data.clear()
+        assert len(data) == 0
+        assert x.parent is None
+
+    def test_init_address(self):
+        data = LinkedDeepDict({('a', 'b'): 1, 'c': 2})
+        assert data['a', 'b'] == 1
+        assert ('a', 'b') in data
+        assert data['a'].parent is data
+        assert data == {'a': {'b': 1}, 'c': 2}
+        data = LinkedDeepDict(locked=True, a=1)
+        assert data.locked
+        self.assertRaises(RuntimeError, data.__setitem__, 'b', 1)
+
+    def test_empty_address(self):
+        data = LinkedDeepDict(a=1)
+        for key in [(), []]:
+            self.assertRaises(KeyError, data.__getitem__, key)
+            self.assertRaises(KeyError, data.__setitem__, key, 1)
+        assert data == {'a': 1}
+
+    def test_single_element_tuple(self):
+        data = LinkedDeepDict()
+        data['a',] = 1
+        assert data['a'] == 1
+        assert ('a',) in data
+        data[('x', 'y'),] = 5
+        assert dict.__contains__(data, ('x', 'y'))
+        assert 'x' not in data
+        assert data[('x', 'y'),] == 5
+        assert (('x', 'y'),) in data
+        assert (('a', 'b'),) not in data
+        data[('p', 'q'),]
+        assert dict.__contains__(data, ('p', 'q'))
+        assert 'p' not in data
+        assert data['m', ('b', 'c')].address == ('m', ('b', 'c'))
+        data[('x', 'y'),] = None
+        assert not dict.__contains__(data, ('x', 'y'))
+
     def test_contains(self):
         data = LinkedDeepDict()
         data['a', 'b', 'c'] = 1
         self.assertTrue(["a", "b", "c"] in data)
         self.assertTrue("a" in data)
+        self.assertTrue(("a", "b", "c") in data)
+        self.assertFalse(("a", "c") in data)
 
     def test_lib_compliance(self):
         """
@@ -68,6 +254,31 @@ class TestDeepDict(unittest.TestCase):
         assert data1 == data2
         assert list(data1.keys()) == list(data1.keys())
         assert list(data1.values()) == list(data1.values())
+        assert data1.keys() == data2.keys()
+        assert data1.items() == data2.items()
+        assert weakref.ref(data1)() is data1
+        assert isinstance(data1, dict)
+
+    @unittest.skipIf(COMPILED, "instances of compiled classes have a __dict__")
+    def test_slots(self):
+        data = LinkedDeepDict(a=1)
+        assert not hasattr(data, '__dict__')
+
+    def test_deep(self):
+        data = LinkedDeepDict({'a': {'aa': {'aaa': 0}}, 'b': 1, 'c': {'cc': 2}})
+        assert list(data.keys(deep=True)) == ['aaa', 'b', 'cc']
+        assert list(data.values(deep=True)) == [0, 1, 2]
+        assert list(data.items(deep=True, return_address=True)) == [
+            (['a', 'aa', 'aaa'], 0), (['b'], 1), (['c', 'cc'], 2)]
+
+    def test_pickle(self):
+        data = LinkedDeepDict()
+        data['a', 'b', 'c'] = 1
+        data['d'] = 2
+        data2 = pickle.loads(pickle.dumps(data))
+        assert data2 == data
+        assert data2['a', 'b'].parent is data2['a']
+        assert data2['a', 'b'].root() is data2
         
         
 if __name__ == "__main__":